@@ -27,6 +27,9 @@ Author:
 from model import Player, Tournament, Database
 from view import View
 import os
+import time
+
+FLUSH_INTERVAL = 5  # Minimum number of seconds between two automatic writes of players.json
 
 
 class Controller:
@@ -40,23 +43,60 @@ class Controller:
 
     Methods:
         create_tournament(): Create a new tournament and save it.
-        add_players(): Add a new player to the database.
-        update_global_scores(): Update global player scores from the current tournament.
+        add_players(auto_flush): Add a new player to the database.
+        bulk_add_players(): Add several players, saving them once at the end.
+        _players_index(): Return the mapping of national_ids to global Player objects.
         manage_rounds(): Manage the rounds of the current tournament.
+        _start_round(): Start the next round of the current tournament.
+        _finish_round(): Finish the current round and record match results.
+        _end_tournament(): End the current tournament after user confirmation and save it.
         manage_existing_tournament(): Manage an existing unfinished tournament.
+        _load_all_tournament_metas(): Load the metadata of all saved tournaments, reusing cached ones.
+        _cached_tournament_meta(entry): Return a tournament's metadata, re-reading it only if modified.
+        _save_tournament(): Save the current tournament and invalidate its cache entry.
+        _flush_tournament(): Save the current tournament if it has unsaved changes.
+        _flush_players(): Save players to the database if they have unsaved changes.
+        _has_data(): Check whether there are players or a current tournament to report on.
         generate_reports(): Generate and display reports.
+        _report_players(): Display all players.
+        _report_tournaments(): Display all saved tournaments.
+        _report_tournament_details(): Let the user select a saved tournament and display its details.
         run(): Run the main application loop.
     """
 
     def __init__(self):
         """Initialize the Controller with database and view.
 
-        Initializes the database, loads existing players, and sets up the view.
+        Initializes the database and sets up the view. Players are loaded on first access.
         """
         self.db = Database()
         self.tournament = None
-        self.players = self.db.load_players()
+        self._players = None
         self.view = View()
+        self._tournament_cache = {}  # filename -> (mtime, metadata dict)
+        self._players_by_id = None  # national_id -> Player, built on demand
+        self._players_dirty = False
+        self._last_players_flush = 0.0
+        self._tournament_dirty = False
+        self._menu = {
+            "1": self.add_players,
+            "2": self.create_tournament,
+            "3": self.manage_existing_tournament,
+            "4": self.manage_rounds,
+            "5": self.generate_reports,
+            "6": self.bulk_add_players,
+        }
+
+    @property
+    def players(self):
+        """Return all players, loading them from the database on first access.
+
+        Returns:
+            list: List of all Player objects.
+        """
+        if self._players is None:
+            self._players = self.db.load_players()
+        return self._players
 
     def create_tournament(self):
         """Create a new tournament and save it.
@@ -68,18 +108,26 @@ class Controller:
             None
         """
         name, location, start_date, description = self.view.get_tournament_info()
+        self._flush_tournament()
         self.tournament = Tournament(name, location, start_date, description)
         self.tournament.add_players_from_database(self.players)
-        self.db.save_tournament(self.tournament)
+        self._save_tournament()
         self.view.display_message(
             f"Tournament '{name}' created successfully with "
             f"{len(self.tournament.players)} players!"
             )
 
-    def add_players(self):
+    def add_players(self, auto_flush=True):
         """Add a new player to the database.
 
-        Prompts the user for player details and saves the new player.
+        Prompts the user for player details and marks the players as unsaved. They are
+        written to disk if FLUSH_INTERVAL seconds elapsed since the last write, and
+        always before a tournament is saved or the application exits, including on
+        Ctrl-C or end of input (see run()).
+
+        Args:
+            auto_flush (bool, optional): Whether to save once FLUSH_INTERVAL has elapsed.
+                Defaults to True.
 
         Returns:
             None
@@ -87,25 +135,37 @@ class Controller:
         firstname, lastname, birthdate, national_id = self.view.get_player_info()
         player = Player(firstname, lastname, birthdate, national_id)
         self.players.append(player)
-        self.db.save_players(self.players)
+        self._players_by_id = None
+        self._players_dirty = True
+        if auto_flush and time.monotonic() - self._last_players_flush >= FLUSH_INTERVAL:
+            self._flush_players()
         self.view.display_message("Player added successfully!")
 
-    def update_global_scores(self):
-        """Update global player scores based on the current tournament's scores.
-
-        Increments the global score of each player based on their tournament performance.
+    def bulk_add_players(self):
+        """Add several players, saving them once at the end.
 
         Returns:
             None
         """
-        if self.tournament:
-            for tour_player in self.tournament.players:
-                global_player = next(
-                    (p for p in self.players if p.national_id == tour_player.national_id), None
-                    )
-                if global_player:
-                    global_player.score += tour_player.score
-            self.db.save_players(self.players)
+        while True:
+            self.add_players(auto_flush=False)
+            if not self.view.confirm_add_another_player():
+                break
+        self._flush_players()
+        self.view.display_message("All players saved!")
+
+    def _players_index(self):
+        """Return the mapping of national_ids to global Player objects.
+
+        The current tournament shares these Player objects, so score changes made during
+        the tournament apply to the global scores directly.
+
+        Returns:
+            dict: Mapping of national_ids to Player objects.
+        """
+        if self._players_by_id is None:
+            self._players_by_id = {p.national_id: p for p in self.players}
+        return self._players_by_id
 
     def manage_rounds(self):
         """Manage the rounds of the current tournament.
@@ -125,66 +185,83 @@ class Controller:
                 )
             return
 
+        handlers = {
+            "1": self._start_round,
+            "2": self._finish_round,
+            "3": self._end_tournament,
+        }
+        display = self.view.display_message
         while True:
             choice = self.view.display_round_management_menu()
-
-            if choice == "1":
-                if self.tournament.start_round():
-                    self.db.save_tournament(self.tournament)
-                    self.view.display_message(
-                        f"Round {self.tournament.current_round} "
-                        "started!"
-                        )
-                else:
-                    self.db.save_tournament(self.tournament)
-                    self.view.display_message(
-                        "No pairs could be generated for this round "
-                        "or the tournament is complete!"
-                        )
-            elif choice == "2":
-                if self.tournament.finish_round():
-                    current_round = self.tournament.rounds[-1]
-                    for match in current_round.matches:
-                        if not match.is_finished:
-                            self.view.display_message(
-                                f"Match: {match.players[0][0].lastname}, "
-                                f"{match.players[0][0].firstname} vs "
-                                f"{match.players[1][0].lastname}, "
-                                f"{match.players[1][0].firstname}"
-                                )
-                            winner_idx = self.view.get_match_result(
-                                match.players[0][0],
-                                match.players[1][0]
-                                )
-                            match.set_result(winner_idx)
-                            for player, score in match.players:
-                                player.score += score
-                    self.db.save_tournament(self.tournament)
-                    self.update_global_scores()
-                    self.view.display_message(
-                        f"Round {self.tournament.current_round} "
-                        "finished!"
-                        )
-                else:
-                    self.view.display_message("No round to finish!")
-            elif choice == "3":
-                if self.view.confirm_end_tournament():
-                    if self.tournament.end_tournament():
-                        self.db.save_tournament(self.tournament)
-                        self.update_global_scores()
-                        self.view.display_message(
-                            f"Tournament '{self.tournament.name}' "
-                            f"ended on {self.tournament.end_date}!"
-                            )
-                    else:
-                        self.view.display_message(
-                            "Cannot end tournament: it must have "
-                            "completed all rounds or already ended."
-                            )
+            handler = handlers.get(choice)
+            if handler:
+                handler()
             elif choice == "4":
+                self._flush_tournament()
                 break
             else:
-                self.view.display_message("Invalid option, try again.")
+                display("Invalid option, try again.")
+
+    def _start_round(self):
+        """Start the next round of the current tournament.
+
+        Returns:
+            None
+        """
+        t = self.tournament
+        if t.start_round():
+            self._tournament_dirty = True
+            self.view.display_message(f"Round {t.current_round} started!")
+        else:
+            self.view.display_message(
+                "No pairs could be generated for this round "
+                "or the tournament is complete!"
+                )
+
+    def _finish_round(self):
+        """Finish the current round and record match results.
+
+        Returns:
+            None
+        """
+        t = self.tournament
+        display = self.view.display_message
+        if not t.finish_round():
+            display("No round to finish!")
+            return
+        current_round = t.rounds[-1]
+        get_result = self.view.get_match_result
+        for match in [m for m in current_round.matches if not m.is_finished]:
+            player1, player2 = match.player1, match.player2
+            display(
+                f"Match: {player1.lastname}, {player1.firstname} vs "
+                f"{player2.lastname}, {player2.firstname}"
+                )
+            # Apply the points as soon as the match is marked finished, so that an
+            # interrupted result entry never saves a finished match without its points
+            for player, score in match.set_result(get_result(player1, player2)):
+                player.score += score
+            self._tournament_dirty = True
+            self._players_dirty = True
+        display(f"Round {t.current_round} finished!")
+
+    def _end_tournament(self):
+        """End the current tournament after user confirmation and save it.
+
+        Returns:
+            None
+        """
+        if not self.view.confirm_end_tournament():
+            return
+        t = self.tournament
+        if t.end_tournament():
+            self._save_tournament()
+            self.view.display_message(f"Tournament '{t.name}' ended on {t.end_date}!")
+        else:
+            self.view.display_message(
+                "Cannot end tournament: it must have "
+                "completed all rounds or already ended."
+                )
 
     def manage_existing_tournament(self):
         """Manage an existing unfinished tournament.
@@ -194,35 +271,101 @@ class Controller:
         Returns:
             None
         """
-        tournaments = []
-        for filename in os.listdir(self.db.tournaments_dir):
-            if filename.endswith('.json'):
-                tournament_name = filename[:-5]
-                tournament = self.db.load_tournament(tournament_name)
-                if tournament:
-                    tournaments.append(tournament)
+        tournaments = self._load_all_tournament_metas()
 
         unfinished_tournaments = self.view.display_unfinished_tournaments(tournaments)
         if unfinished_tournaments is None:
             self.view.display_message("No unfinished tournaments available.")
             return
 
-        try:
-            choice = int(
-                input("Select an unfinished tournament by number (or 0 to cancel): ")
-                )
-            if choice == 0:
-                self.view.display_message("Returning to main menu.")
-                return
-            if 1 <= choice <= len(unfinished_tournaments):
-                self.tournament = unfinished_tournaments[choice - 1]
-                self.db.save_tournament(self.tournament)
-                self.view.display_message(f"Loaded tournament: {self.tournament.name}")
-                self.manage_rounds()
-            else:
-                self.view.display_message("Invalid choice, returning to main menu.")
-        except ValueError:
-            self.view.display_message("Please enter a number, returning to main menu.")
+        choice = self.view.get_tournament_choice(len(unfinished_tournaments))
+        if choice is None:
+            self.view.display_message("Returning to main menu.")
+            return
+        tournament = self.db.load_tournament(unfinished_tournaments[choice - 1]["file"])
+        if not tournament:
+            self.view.display_message("Could not load this tournament, returning to main menu.")
+            return
+        self._flush_tournament()
+        tournament.share_players(self._players_index())
+        self.tournament = tournament
+        self._save_tournament()
+        self.view.display_message(f"Loaded tournament: {self.tournament.name}")
+        self.manage_rounds()
+
+    def _load_all_tournament_metas(self):
+        """Load the metadata of all saved tournaments, reusing cached ones.
+
+        Only files whose modification time changed since the last scan are
+        re-read from disk.
+
+        Returns:
+            list: List of tournament metadata dicts (see Database.load_tournament_meta).
+        """
+        with os.scandir(self.db.tournaments_dir) as entries:
+            json_entries = [entry for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+        for filename in set(self._tournament_cache) - {entry.name for entry in json_entries}:
+            del self._tournament_cache[filename]
+        return [m for m in (self._cached_tournament_meta(entry) for entry in json_entries) if m is not None]
+
+    def _cached_tournament_meta(self, entry):
+        """Return a tournament's metadata, re-reading it only if its file was modified.
+
+        Args:
+            entry (os.DirEntry): Directory entry of a tournament JSON file.
+
+        Returns:
+            dict: The tournament metadata, or None if it could not be loaded.
+        """
+        mtime = entry.stat().st_mtime
+        cached = self._tournament_cache.get(entry.name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        meta = self.db.load_tournament_meta(entry.name[:-5])
+        if meta:
+            self._tournament_cache[entry.name] = (mtime, meta)
+        else:
+            self._tournament_cache.pop(entry.name, None)
+        return meta
+
+    def _save_tournament(self):
+        """Save the current tournament and invalidate its cache entry.
+
+        Returns:
+            None
+        """
+        self._flush_players()
+        self.db.save_tournament(self.tournament)
+        self._tournament_dirty = False
+        self._tournament_cache.pop(f"{self.tournament.name}.json", None)
+
+    def _flush_tournament(self):
+        """Save the current tournament if it has unsaved changes.
+
+        Returns:
+            None
+        """
+        if self._tournament_dirty:
+            self._save_tournament()
+
+    def _flush_players(self):
+        """Save players to the database if they have unsaved changes.
+
+        Returns:
+            None
+        """
+        if self._players_dirty:
+            self.db.save_players(self.players)
+            self._players_dirty = False
+            self._last_players_flush = time.monotonic()
+
+    def _has_data(self):
+        """Check whether there are players or a current tournament to report on.
+
+        Returns:
+            bool: True if any report data is available, False otherwise.
+        """
+        return bool(self.players or self.tournament)
 
     def generate_reports(self):
         """Generate and display reports.
@@ -232,63 +375,75 @@ class Controller:
         Returns:
             None
         """
-        if not self.players and not self.tournament:
+        if not self._has_data():
             self.view.display_message("No data available for reports!")
             return
 
+        handlers = {
+            "1": self._report_players,
+            "2": self._report_tournaments,
+            "3": self._report_tournament_details,
+        }
         while True:
             choice = self.view.display_reports_menu()
-
-            if choice == "1":
-                self.view.display_players(self.players)
-            elif choice == "2":
-                tournaments = []
-                for filename in os.listdir(self.db.tournaments_dir):
-                    if filename.endswith('.json'):
-                        tournament_name = filename[:-5]
-                        tournament = self.db.load_tournament(tournament_name)
-                        if tournament:
-                            tournaments.append(tournament)
-                self.view.display_tournaments(tournaments)
-            elif choice == "3":
-                tournaments = []
-                for filename in os.listdir(self.db.tournaments_dir):
-                    if filename.endswith('.json'):
-                        tournament_name = filename[:-5]
-                        tournament = self.db.load_tournament(tournament_name)
-                        if tournament:
-                            tournaments.append(tournament)
-                selected_tournament = self.view.select_tournament(tournaments)
-                if selected_tournament:
-                    self.view.display_tournament_details(selected_tournament)
+            handler = handlers.get(choice)
+            if handler:
+                handler()
             elif choice == "4":
                 break
             else:
                 self.view.display_message("Invalid option, try again.")
 
+    def _report_players(self):
+        """Display all players.
+
+        Returns:
+            None
+        """
+        self.view.display_players(self.players)
+
+    def _report_tournaments(self):
+        """Display all saved tournaments.
+
+        Returns:
+            None
+        """
+        self.view.display_tournaments(self._load_all_tournament_metas())
+
+    def _report_tournament_details(self):
+        """Let the user select a saved tournament and display its details.
+
+        Returns:
+            None
+        """
+        selected_tournament = self.view.select_tournament(self._load_all_tournament_metas())
+        if selected_tournament:
+            self.view.display_tournament_details(
+                self.db.load_tournament(selected_tournament["file"])
+                )
+
     def run(self):
         """Run the main application loop.
 
-        Starts the interactive menu and processes user choices.
+        Starts the interactive menu and processes user choices. Unsaved players and
+        tournament changes are written on exit, including on Ctrl-C or end of input.
 
         Returns:
             None
         """
-        self.view = View()
-        while True:
-            choice = self.view.display_menu()
-            if choice == "1":
-                self.add_players()
-            elif choice == "2":
-                self.create_tournament()
-            elif choice == "3":
-                self.manage_existing_tournament()
-            elif choice == "4":
-                self.manage_rounds()
-            elif choice == "5":
-                self.generate_reports()
-            elif choice == "6":
-                self.view.display_message("Goodbye!")
-                break
-            else:
-                self.view.display_message("Invalid option, try again.")
+        try:
+            while True:
+                choice = self.view.display_menu()
+                handler = self._menu.get(choice)
+                if handler:
+                    handler()
+                elif choice == "7":
+                    break
+                else:
+                    self.view.display_message("Invalid option, try again.")
+        except (KeyboardInterrupt, EOFError):
+            self.view.display_message("")
+        finally:
+            self._flush_tournament()
+            self._flush_players()
+        self.view.display_message("Goodbye!")
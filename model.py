@@ -25,10 +25,73 @@ Author:
     Updated: March 06, 2025
 """
 
+import collections
 import json
 import os
 import random
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import attrgetter
+
+try:
+    import orjson  # Optional, faster JSON encoding and decoding
+except ImportError:
+    orjson = None
+
+TOURNAMENT_META_KEYS = ("name", "location", "start_date", "end_date")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _pair_key(a, b):
+    """Return an order-independent key for a pair of national_ids.
+
+    Args:
+        a (str): The first national_id.
+        b (str): The second national_id.
+
+    Returns:
+        tuple: The two national_ids in ascending order.
+    """
+    return (a, b) if a <= b else (b, a)
+
+
+def _timestamp():
+    """Return the current time formatted as "DD-MM-YYYY HH:MM:SS".
+
+    Returns:
+        str: The formatted current time.
+    """
+    n = datetime.now()
+    return f"{n.day:02d}-{n.month:02d}-{n.year:04d} {n.hour:02d}:{n.minute:02d}:{n.second:02d}"
+
+
+def _dumps(obj):
+    """Serialize an object to an indented UTF-8 JSON document, using orjson when available.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=4).encode()
+
+
+def _loads(data):
+    """Deserialize a JSON document, using orjson when available.
+
+    Args:
+        data (bytes): The UTF-8 JSON document.
+
+    Returns:
+        The deserialized object.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class Player:
@@ -45,6 +108,8 @@ class Player:
         to_dict(): Return a dictionary representation of the player.
     """
 
+    __slots__ = ("firstname", "lastname", "birthdate", "national_id", "_score", "_cached_dict", "_dict_dirty")
+
     def __init__(self, firstname, lastname, birthdate, national_id, score=0):
         """Initialize a Player with given attributes.
 
@@ -59,28 +124,48 @@ class Player:
         self.lastname = lastname
         self.birthdate = birthdate  # Format: "DD-MM-YYYY"
         self.national_id = national_id  # e.g., "AB12345"
+        self._cached_dict = None
         self.score = score  # Cumulative score across tournaments
 
+    @property
+    def score(self):
+        """int: The cumulative score across all tournaments."""
+        return self._score
+
+    @score.setter
+    def score(self, value):
+        self._score = value
+        self._dict_dirty = True
+
     def to_dict(self):
         """Return a dictionary representation of the player.
 
+        The dictionary is cached and only rebuilt after the score, the sole attribute
+        changed after creation, is set. It must not be mutated.
+
         Returns:
             dict: A dictionary containing player attributes.
         """
-        return {
-            "firstname": self.firstname,
-            "lastname": self.lastname,
-            "birthdate": self.birthdate,
-            "national_id": self.national_id,
-            "score": self.score
-        }
+        if self._dict_dirty:
+            self._cached_dict = {
+                "firstname": self.firstname,
+                "lastname": self.lastname,
+                "birthdate": self.birthdate,
+                "national_id": self.national_id,
+                "score": self._score
+            }
+            self._dict_dirty = False
+        return self._cached_dict
 
 
 class Match:
     """A class representing a chess match between two players.
 
     Attributes:
-        players (list): List of [player, score] pairs for the two players.
+        player1 (Player): The first player.
+        player2 (Player): The second player.
+        score1 (float): The first player's score in this match.
+        score2 (float): The second player's score in this match.
         white_player (int): Index (0 or 1) indicating the white player.
         is_finished (bool): Whether the match has concluded.
 
@@ -90,6 +175,8 @@ class Match:
         from_dict(cls, data, players_by_id): Reconstruct a Match from dictionary data.
     """
 
+    __slots__ = ("player1", "player2", "score1", "score2", "white_player", "is_finished")
+
     def __init__(self, player1, player2):
         """Initialize a Match with two players and random white/black assignment.
 
@@ -97,8 +184,11 @@ class Match:
             player1 (Player): The first player.
             player2 (Player): The second player.
         """
-        self.players = [[player1, 0], [player2, 0]]  # [player, score]
-        self.white_player = random.choice([0, 1])
+        self.player1 = player1
+        self.player2 = player2
+        self.score1 = 0
+        self.score2 = 0
+        self.white_player = random.getrandbits(1)
         self.is_finished = False
 
     def set_result(self, winner_idx=None):
@@ -106,26 +196,32 @@ class Match:
 
         Args:
             winner_idx (int, optional): Index of the winning player (0 or 1). None for draw.
+
+        Returns:
+            tuple: The (player, score) pairs of the match, for batch score updates.
         """
-        if winner_idx is not None:
-            self.players[winner_idx][1] = 1  # Winner gets 1 point
-            self.players[1 - winner_idx][1] = 0  # Loser gets 0
+        if winner_idx is None:
+            self.score1 = self.score2 = 0.5  # Draw, both get 0.5
         else:
-            self.players[0][1] = 0.5  # Draw, both get 0.5
-            self.players[1][1] = 0.5
+            self.score1 = 1 if winner_idx == 0 else 0  # Winner gets 1 point, loser 0
+            self.score2 = 1 - self.score1
         self.is_finished = True
+        return (self.player1, self.score1), (self.player2, self.score2)
 
     def to_dict(self):
         """Return a dictionary representation of the match.
 
+        Players are referenced by national_id; their details are stored once in the
+        tournament's "players" list.
+
         Returns:
             dict: A dictionary containing match details.
         """
         return {
-            "players": [
-                [p[0].to_dict() if isinstance(p[0], Player) else p[0].to_dict(), p[1]]
-                for p in self.players
-            ],
+            "player1_id": self.player1.national_id,
+            "player2_id": self.player2.national_id,
+            "score1": self.score1,
+            "score2": self.score2,
             "white_player": self.white_player,
             "is_finished": self.is_finished
         }
@@ -142,24 +238,18 @@ class Match:
             Match: A reconstructed Match object.
 
         Raises:
-            ValueError: If player data is invalid.
+            KeyError: If a field is missing or a player is not in players_by_id.
         """
-        match = cls(None, None)
+        if "players" in data:  # Legacy format: each match embeds the full player dicts.
+            (player1_data, score1), (player2_data, score2) = data["players"]
+            match = cls(players_by_id[player1_data["national_id"]], players_by_id[player2_data["national_id"]])
+        else:
+            match = cls(players_by_id[data["player1_id"]], players_by_id[data["player2_id"]])
+            score1, score2 = data["score1"], data["score2"]
+        match.score1 = score1
+        match.score2 = score2
         match.white_player = data["white_player"]
         match.is_finished = data["is_finished"]
-        match.players = []
-        for player_data, score in data["players"]:
-            if isinstance(player_data, dict):
-                national_id = player_data.get("national_id", "XX00000")
-                player = players_by_id.get(national_id)
-                if player:
-                    match.players.append([player, score])
-                else:
-                    match.players.append([
-                        Player(**{**player_data, "national_id": national_id}), score
-                    ])
-            else:
-                raise ValueError("Invalid player data in Match")
         return match
 
 
@@ -178,20 +268,24 @@ class Round:
         from_dict(cls, data, players_by_id): Reconstruct a Round from dictionary data.
     """
 
-    def __init__(self, name):
+    __slots__ = ("name", "matches", "start_time", "end_time")
+
+    def __init__(self, name, start_time=None):
         """Initialize a Round with a name and timestamps.
 
         Args:
             name (str): The name of the round (e.g., "Round 1").
+            start_time (str, optional): Start time in "DD-MM-YYYY HH:MM:SS" format.
+                Defaults to the current time.
         """
         self.name = name  # e.g., "Round 1"
         self.matches = []
-        self.start_time = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
+        self.start_time = start_time or _timestamp()
         self.end_time = None
 
     def finish(self):
         """Set the end time when the round is finished."""
-        self.end_time = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
+        self.end_time = _timestamp()
 
     def to_dict(self):
         """Return a dictionary representation of the round.
@@ -217,8 +311,7 @@ class Round:
         Returns:
             Round: A reconstructed Round object.
         """
-        round_obj = cls(data["name"])
-        round_obj.start_time = data["start_time"]
+        round_obj = cls(data["name"], data["start_time"])
         round_obj.end_time = data["end_time"]
         for match_data in data["matches"]:
             round_obj.matches.append(Match.from_dict(match_data, players_by_id))
@@ -238,17 +331,23 @@ class Tournament:
         rounds (list): List of Round objects.
         players (list): List of Player objects participating.
         description (str): Optional description of the tournament.
-        all_possible_pairs (list): List of all possible player pairings.
+        used_pairs (set): Sorted (national_id, national_id) pairs that already played each other.
 
     Methods:
         to_dict(): Return a dictionary representation of the tournament.
         add_players_from_database(available_players): Add players from the database.
+        share_players(players_by_id): Replace players with the matching shared Player objects.
         generate_pairs(): Generate pairs for the current round based on scores.
         start_round(): Start a new round if conditions are met.
         finish_round(): Finish the current round if conditions are met.
         end_tournament(): End the tournament if all rounds are completed.
     """
 
+    __slots__ = (
+        "name", "location", "start_date", "end_date", "number_of_rounds", "current_round",
+        "rounds", "players", "description", "used_pairs"
+    )
+
     def __init__(self, name, location, start_date, description=""):
         """Initialize a Tournament with given attributes.
 
@@ -267,7 +366,7 @@ class Tournament:
         self.rounds = []
         self.players = []  # Will be populated from the database
         self.description = description
-        self.all_possible_pairs = []  # Track all possible player pairings
+        self.used_pairs = set()  # Updated as rounds are started
 
     def to_dict(self):
         """Return a dictionary representation of the tournament.
@@ -290,21 +389,33 @@ class Tournament:
     def add_players_from_database(self, available_players):
         """Add players from the database to the tournament.
 
+        The Player objects are shared with the database list, not copied.
+
         Args:
             available_players (list): List of Player objects from the database.
 
         Returns:
             None
         """
-        self.players = [Player(**player.to_dict()) for player in available_players]
-        self.all_possible_pairs = []
-        if len(self.players) >= 2:
-            for i in range(len(self.players)):
-                for j in range(i + 1, len(self.players)):
-                    pair = tuple(sorted([
-                        self.players[i].national_id, self.players[j].national_id
-                    ]))
-                    self.all_possible_pairs.append(pair)
+        self.players = list(available_players)
+
+    def share_players(self, players_by_id):
+        """Replace the tournament's players with the matching shared Player objects.
+
+        Players are matched by national_id, in the player list and in every match.
+        Players missing from the mapping are kept as they are.
+
+        Args:
+            players_by_id (dict): Mapping of national_ids to the Player objects to share.
+
+        Returns:
+            None
+        """
+        self.players = [players_by_id.get(p.national_id, p) for p in self.players]
+        for round_obj in self.rounds:
+            for match in round_obj.matches:
+                match.player1 = players_by_id.get(match.player1.national_id, match.player1)
+                match.player2 = players_by_id.get(match.player2.national_id, match.player2)
 
     def generate_pairs(self):
         """Generate pairs for the current round based on scores.
@@ -315,57 +426,24 @@ class Tournament:
         if not self.players or len(self.players) < 2:
             return []
         if self.current_round == 0:
-            used_pairs = set()
-            pairs = []
-            remaining_pairs = self.all_possible_pairs.copy()
-            random.shuffle(remaining_pairs)
-            for pair in remaining_pairs:
-                if len(pairs) >= (len(self.players) + 1) // 2:
-                    break
-                p1_id, p2_id = pair
-                p1 = next((p for p in self.players if p.national_id == p1_id), None)
-                p2 = next((p for p in self.players if p.national_id == p2_id), None)
-                if p1 and p2:
-                    pair_key = tuple(sorted([p1.national_id, p2.national_id]))
-                    if pair_key not in used_pairs:
-                        pairs.append((p1, p2))
-                        used_pairs.add(pair_key)
-            return pairs
+            # Pairing consecutive players of a random permutation gives a uniform random pairing
+            order = random.sample(self.players, len(self.players))
+            return [(order[i], order[i + 1]) for i in range(0, len(order) - 1, 2)]
         else:
-            self.players.sort(key=lambda p: p.score, reverse=True)
+            self.players.sort(key=attrgetter("score"), reverse=True)
             pairs = []
-            used_pairs = set()
-            for round_obj in self.rounds:
-                for match in round_obj.matches:
-                    p1, p2 = match.players
-                    if isinstance(p1[0], dict):
-                        p1 = [Player(**{k: v for k, v in p1[0].items() if k in [
-                            "firstname", "lastname", "birthdate", "national_id", "score"
-                        ]}), p1[1]]
-                    if isinstance(p2[0], dict):
-                        p2 = [Player(**{k: v for k, v in p2[0].items() if k in [
-                            "firstname", "lastname", "birthdate", "national_id", "score"
-                        ]}), p2[1]]
-                    pair_key = tuple(sorted([p1[0].national_id, p2[0].national_id]))
-                    used_pairs.add(pair_key)
-            for i in range(0, len(self.players), 2):
-                if i + 1 >= len(self.players):
-                    break
-                player1, player2 = self.players[i], self.players[i + 1]
-                pair_key = tuple(sorted([player1.national_id, player2.national_id]))
-                if pair_key not in used_pairs:
-                    pairs.append((player1, player2))
+            used_pairs = self.used_pairs
+            # Pair the top-ranked available player with the next-ranked one they have not met yet
+            available = collections.deque(self.players)
+            while len(available) > 1:
+                player1 = available.popleft()
+                for player2 in available:
+                    if _pair_key(player1.national_id, player2.national_id) not in used_pairs:
+                        break
                 else:
-                    for j in range(i + 2, len(self.players), 2):
-                        if j + 1 >= len(self.players):
-                            break
-                        alt_player2 = self.players[j]
-                        alt_pair_key = tuple(sorted([
-                            player1.national_id, alt_player2.national_id
-                        ]))
-                        if alt_pair_key not in used_pairs:
-                            pairs.append((player1, alt_player2))
-                            break
+                    continue  # Already met everyone left, sits out this round
+                available.remove(player2)
+                pairs.append((player1, player2))
             return pairs
 
     def start_round(self):
@@ -385,6 +463,7 @@ class Tournament:
             return False
         for player1, player2 in pairs:
             new_round.matches.append(Match(player1, player2))
+            self.used_pairs.add(_pair_key(player1.national_id, player2.national_id))
         self.rounds.append(new_round)
         self.current_round += 1
         return True
@@ -421,12 +500,16 @@ class Database:
     Attributes:
         players_dir (str): Path to the directory storing player data.
         tournaments_dir (str): Path to the directory storing tournament data.
+        players_file (str): Path to players.json.
+        _tournament_cache (dict): Mapping of tournament file paths to (mtime_ns, decoded data).
 
     Methods:
         ensure_directories(): Ensure data directories exist.
         load_players(): Load players from players.json.
         save_players(players): Save players to players.json.
         load_tournament(tournament_name): Load a tournament from its JSON file.
+        load_tournaments(tournament_names): Load several tournaments concurrently.
+        load_tournament_meta(tournament_name): Load only the listing metadata of a tournament.
         save_tournament(tournament): Save a tournament to its JSON file.
     """
 
@@ -434,11 +517,17 @@ class Database:
         """Initialize the Database with directory paths."""
         self.players_dir = "data/players"
         self.tournaments_dir = "data/tournaments"
+        self.players_file = os.path.join(self.players_dir, "players.json")
+        self._dirs_ensured = False
+        self._tournament_cache = {}
 
     def ensure_directories(self):
-        """Ensure data directories exist."""
+        """Ensure data directories exist, checking the filesystem only on the first call."""
+        if self._dirs_ensured:
+            return
         os.makedirs(self.players_dir, exist_ok=True)
         os.makedirs(self.tournaments_dir, exist_ok=True)
+        self._dirs_ensured = True
 
     def load_players(self):
         """Load players from players.json.
@@ -446,10 +535,9 @@ class Database:
         Returns:
             list: List of Player objects.
         """
-        players_file = os.path.join(self.players_dir, "players.json")
-        if os.path.exists(players_file):
-            with open(players_file, "r") as file:
-                data = json.load(file)
+        if os.path.exists(self.players_file):
+            with open(self.players_file, "rb") as file:
+                data = _loads(file.read())
                 return [Player(**player) for player in data]
         return []
 
@@ -463,40 +551,109 @@ class Database:
             None
         """
         self.ensure_directories()
-        players_file = os.path.join(self.players_dir, "players.json")
-        with open(players_file, "w") as file:
-            json.dump([player.to_dict() for player in players], file, indent=4)
+        with open(self.players_file, "wb") as file:
+            file.write(_dumps([player.to_dict() for player in players]))
 
     def load_tournament(self, tournament_name):
         """Load a tournament from its JSON file.
 
+        The file is only read and decoded again if it was modified since the last load or
+        save. A new Tournament is built on every call, so changes made to a returned
+        tournament never leak into later loads.
+
+        Args:
+            tournament_name (str): Name of the tournament file (without .json).
+
+        Returns:
+            Tournament: A reconstructed Tournament object, or None if not found or
+                corrupted.
+        """
+        tournament_file = os.path.join(self.tournaments_dir, f"{tournament_name}.json")
+        try:
+            mtime = os.stat(tournament_file).st_mtime_ns
+        except FileNotFoundError:
+            self._tournament_cache.pop(tournament_file, None)
+            return None
+        cached = self._tournament_cache.get(tournament_file)
+        if cached is not None and cached[0] == mtime:
+            data = cached[1]
+        else:
+            with open(tournament_file, "rb") as file:
+                data = _loads(file.read())
+            self._tournament_cache[tournament_file] = (mtime, data)
+        try:
+            tournament = Tournament(
+                data["name"],
+                data["location"],
+                data["start_date"],
+                data["description"]
+            )
+            tournament.end_date = data["end_date"]
+            tournament.number_of_rounds = data["number_of_rounds"]
+            tournament.current_round = data["current_round"]
+            players_by_id = {player["national_id"]: Player(**player) for player in data["players"]}
+            tournament.rounds = [Round.from_dict(r, players_by_id) for r in data["rounds"]]
+        except KeyError:
+            return None  # Corrupted file: a field or a match player is missing
+        tournament.used_pairs = {
+            _pair_key(match.player1.national_id, match.player2.national_id)
+            for round_obj in tournament.rounds
+            for match in round_obj.matches
+        }
+        tournament.players = list(players_by_id.values())
+        return tournament
+
+    def load_tournaments(self, tournament_names):
+        """Load several tournaments concurrently.
+
+        File reads release the GIL, so a thread pool overlaps the disk I/O of several files.
+
+        Args:
+            tournament_names (list): Names of the tournament files (without .json).
+
+        Returns:
+            list: The loaded Tournament objects, in the given order, skipping those not found.
+        """
+        if not tournament_names:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(tournament_names))) as executor:
+            tournaments = executor.map(self.load_tournament, tournament_names)
+            return [t for t in tournaments if t is not None]
+
+    def load_tournament_meta(self, tournament_name):
+        """Load only the listing metadata of a tournament from its JSON file.
+
+        Top-level values are decoded one at a time and decoding stops as soon as all
+        TOURNAMENT_META_KEYS are found. Since these keys are saved before the rounds and
+        players, those are never parsed.
+
         Args:
             tournament_name (str): Name of the tournament file (without .json).
 
         Returns:
-            Tournament: A reconstructed Tournament object, or None if not found.
+            dict: The TOURNAMENT_META_KEYS values plus a "finished" flag and the "file" name
+                (without .json) to load the tournament from, or None if not found.
         """
         tournament_file = os.path.join(self.tournaments_dir, f"{tournament_name}.json")
-        if os.path.exists(tournament_file):
-            with open(tournament_file, "r") as file:
-                data = json.load(file)
-                tournament = Tournament(
-                    data["name"],
-                    data["location"],
-                    data["start_date"],
-                    data["description"]
-                )
-                tournament.end_date = data["end_date"]
-                tournament.number_of_rounds = data["number_of_rounds"]
-                tournament.current_round = data["current_round"]
-                players_by_id = {
-                    p.national_id: p
-                    for p in [Player(**player) for player in data["players"]]
-                }
-                tournament.rounds = [Round.from_dict(r, players_by_id) for r in data["rounds"]]
-                tournament.players = [Player(**player) for player in data["players"]]
-                return tournament
-        return None
+        if not os.path.exists(tournament_file):
+            return None
+        with open(tournament_file, "rb") as file:
+            text = file.read().decode("utf-8")
+        decoder = json.JSONDecoder()
+        meta = {}
+        idx = _WHITESPACE.match(text, text.index("{") + 1).end()
+        while len(meta) < len(TOURNAMENT_META_KEYS) and text[idx] != "}":
+            key, idx = decoder.raw_decode(text, idx)
+            idx = _WHITESPACE.match(text, idx).end() + 1  # Skip the ":" separator
+            value, idx = decoder.raw_decode(text, _WHITESPACE.match(text, idx).end())
+            if key in TOURNAMENT_META_KEYS:
+                meta[key] = value
+            idx = _WHITESPACE.match(text, idx).end()
+            if text[idx] == ",":
+                idx = _WHITESPACE.match(text, idx + 1).end()
+        meta["finished"] = meta.get("end_date") is not None
+        meta["file"] = tournament_name
+        return meta
 
     def save_tournament(self, tournament):
         """Save a tournament to its JSON file.
@@ -509,5 +666,7 @@ class Database:
         """
         self.ensure_directories()
         tournament_file = os.path.join(self.tournaments_dir, f"{tournament.name}.json")
-        with open(tournament_file, "w") as file:
-            json.dump(tournament.to_dict(), file, indent=4)
+        data = tournament.to_dict()
+        with open(tournament_file, "wb") as file:
+            file.write(_dumps(data))
+        self._tournament_cache[tournament_file] = (os.stat(tournament_file).st_mtime_ns, data)
@@ -22,6 +22,10 @@ Author:
 """
 
 import random
+import sys
+from operator import attrgetter
+
+_WHITE_BLACK = (("White", "Black"), ("Black", "White"))  # Colour labels indexed by Match.white_player
 
 
 class View:
@@ -37,21 +41,24 @@ class View:
         get_tournament_info(): Get tournament details from user input.
         get_player_info(): Get player details from user input.
         display_players(players): Display a sorted list of players with lifetime scores.
-        display_tournaments(tournaments): Display a list of all tournaments.
+        _player_lines(players): Build the lines of a sorted list of players with lifetime scores.
+        display_tournaments(tournaments): Display a list of all tournaments from their metadata.
         display_unfinished_tournaments(tournaments): Display a list of unfinished tournaments.
         display_tournament_details(tournament): Display detailed information about a tournament.
         display_message(message): Display a message to the user.
         get_choice(prompt): Get a choice from the user with a custom prompt.
         get_match_result(player1, player2): Get the result of a match from user input.
         confirm_end_tournament(): Confirm with the user to end the tournament.
+        confirm_add_another_player(): Ask the user whether to add another player.
         select_tournament(tournaments): Allow user to select a tournament from a list.
+        get_tournament_choice(max_n): Get a validated tournament number from user input.
     """
 
     def display_menu(self):
         """Display the main menu and get user choice.
 
         Returns:
-            str: The user's menu choice (1-6).
+            str: The user's menu choice (1-7).
         """
         print("\n=== Chess Tournament Management ===")
         print("1. Add players")
@@ -59,8 +66,9 @@ class View:
         print("3. Manage existing tournament")
         print("4. Manage tournament rounds")
         print("5. Generate reports")
-        print("6. Exit")
-        return input("Choose an option (1-6): ")
+        print("6. Bulk add players")
+        print("7. Exit")
+        return input("Choose an option (1-7): ")
 
     def display_round_management_menu(self):
         """Display the round management menu and get user choice.
@@ -121,17 +129,29 @@ class View:
         Returns:
             None
         """
-        print("\nPlayers (alphabetical by lastname, firstname) with Lifetime Scores:")
-        sorted_players = sorted(players, key=lambda p: (p.lastname, p.firstname))
+        sys.stdout.write("\n".join(self._player_lines(players)) + "\n")
+
+    def _player_lines(self, players):
+        """Build the lines of a sorted list of players with lifetime scores.
+
+        Args:
+            players (list): List of Player objects to list.
+
+        Returns:
+            list: The lines to display, without trailing newlines.
+        """
+        lines = ["\nPlayers (alphabetical by lastname, firstname) with Lifetime Scores:"]
+        sorted_players = sorted(players, key=attrgetter("lastname", "firstname"))
         for i, player in enumerate(sorted_players, 1):
-            print(f"{i}. {player.lastname}, {player.firstname} (ID: {player.national_id}, "
-                  f"Birthdate: {player.birthdate}, Lifetime Score: {player.score})")
+            lines.append(f"{i}. {player.lastname}, {player.firstname} (ID: {player.national_id}, "
+                         f"Birthdate: {player.birthdate}, Lifetime Score: {player.score})")
+        return lines
 
     def display_tournaments(self, tournaments):
-        """Display a list of all tournaments.
+        """Display a list of all tournaments from their metadata.
 
         Args:
-            tournaments (list): List of Tournament objects to display.
+            tournaments (list): List of tournament metadata dicts to display.
 
         Returns:
             None
@@ -141,24 +161,24 @@ class View:
             return
         print("\nTournaments:")
         for i, t in enumerate(tournaments, 1):
-            print(f"{i}. {t.name} ({t.location}, {t.start_date} - {t.end_date or 'Ongoing'})")
+            print(f"{i}. {t['name']} ({t['location']}, {t['start_date']} - {t['end_date'] or 'Ongoing'})")
 
     def display_unfinished_tournaments(self, tournaments):
         """Display a list of unfinished tournaments.
 
         Args:
-            tournaments (list): List of Tournament objects to filter.
+            tournaments (list): List of tournament metadata dicts to filter.
 
         Returns:
-            list: List of unfinished Tournament objects, or None if none available.
+            list: List of unfinished tournament metadata dicts, or None if none available.
         """
-        unfinished_tournaments = [t for t in tournaments if t.end_date is None]
+        unfinished_tournaments = [t for t in tournaments if not t["finished"]]
         if not unfinished_tournaments:
             print("\nNo unfinished tournaments available.")
             return None
         print("\nUnfinished Tournaments:")
         for i, t in enumerate(unfinished_tournaments, 1):
-            print(f"{i}. {t.name} ({t.location}, {t.start_date} - {t.end_date or 'Ongoing'})")
+            print(f"{i}. {t['name']} ({t['location']}, {t['start_date']} - Ongoing)")
         return unfinished_tournaments
 
     def display_tournament_details(self, tournament):
@@ -173,23 +193,25 @@ class View:
         if not tournament:
             print("\nNo tournament available.")
             return
-        print(f"\nTournament: {tournament.name}")
-        print(f"Location: {tournament.location}")
-        print(f"Dates: {tournament.start_date} - {tournament.end_date or 'Ongoing'}")
-        print(f"Description: {tournament.description}")
-        print(f"Number of Rounds: {tournament.number_of_rounds}")
-        print(f"Current Round: {tournament.current_round}")
-        self.display_players(tournament.players)
-        print("\nRounds and Matches:")
+        lines = [
+            f"\nTournament: {tournament.name}",
+            f"Location: {tournament.location}",
+            f"Dates: {tournament.start_date} - {tournament.end_date or 'Ongoing'}",
+            f"Description: {tournament.description}",
+            f"Number of Rounds: {tournament.number_of_rounds}",
+            f"Current Round: {tournament.current_round}",
+        ]
+        lines.extend(self._player_lines(tournament.players))
+        lines.append("\nRounds and Matches:")
         for round_obj in tournament.rounds:
-            print(f"{round_obj.name} ({round_obj.start_time} - {round_obj.end_time or 'Ongoing'})")
+            lines.append(f"{round_obj.name} ({round_obj.start_time} - {round_obj.end_time or 'Ongoing'})")
             for match in round_obj.matches:
-                p1, p2 = match.players
-                white = "White" if match.white_player == 0 else "Black"
-                black = "Black" if match.white_player == 0 else "White"
-                print(f"  - {p1[0].lastname}, {p1[0].firstname} ({white}) vs "
-                      f"{p2[0].lastname}, {p2[0].firstname} ({black})")
-                print(f"    Scores: {p1[1]} - {p2[1]}")
+                p1, p2 = match.player1, match.player2
+                white, black = _WHITE_BLACK[match.white_player]
+                lines.append(f"  - {p1.lastname}, {p1.firstname} ({white}) vs "
+                             f"{p2.lastname}, {p2.firstname} ({black})")
+                lines.append(f"    Scores: {match.score1} - {match.score2}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def display_message(self, message):
         """Display a message to the user.
@@ -223,15 +245,16 @@ class View:
         Returns:
             int or None: 0 for player1 win, 1 for player2 win, None for draw.
         """
-        print(f"\nMatch: {player1.lastname}, {player1.firstname} vs {player2.lastname}, "
-              f"{player2.firstname}")
-        print("Default outcome is a win/loss (press 1 for Player 1 win, 2 for Player 2 "
-              "win).")
-        print("To specify a draw, type 'draw' and confirm twice (very rare in chess "
-              "tournaments):")
+        prompt = (f"\nMatch: {player1.lastname}, {player1.firstname} vs {player2.lastname}, "
+                  f"{player2.firstname}\n"
+                  "Default outcome is a win/loss (press 1 for Player 1 win, 2 for Player 2 "
+                  "win).\n"
+                  "To specify a draw, type 'draw' and confirm twice (very rare in chess "
+                  "tournaments):\n"
+                  "Choice (1/2) or 'draw': ")
         while True:
-            choice = input(
-                "Choice (1/2) or 'draw': ").lower()
+            choice = input(prompt).lower()
+            prompt = "Choice (1/2) or 'draw': "
             if choice in ["1", "2"]:
                 return 0 if choice == "1" else 1
             elif choice == "draw":
@@ -244,7 +267,7 @@ class View:
                         "Enter to default to win/loss): ").lower()
                     if second_confirm == "confirm":
                         return None
-                default_choice = random.choice(["1", "2"])
+                default_choice = "1" if random.getrandbits(1) else "2"
                 print(f"Defaulting to {default_choice} (win/loss) due to lack of "
                       "confirmation for draw.")
                 return 0 if default_choice == "1" else 1
@@ -259,14 +282,22 @@ class View:
         """
         return input("End tournament? (yes/no): ").lower() == "yes"
 
+    def confirm_add_another_player(self):
+        """Ask the user whether to add another player.
+
+        Returns:
+            bool: True if confirmed, False otherwise.
+        """
+        return input("Add another player? (yes/no): ").lower() == "yes"
+
     def select_tournament(self, tournaments):
         """Allow user to select a tournament from a list.
 
         Args:
-            tournaments (list): List of Tournament objects to choose from.
+            tournaments (list): List of tournament metadata dicts to choose from.
 
         Returns:
-            Tournament: The selected Tournament object, or None if cancelled.
+            dict: The selected tournament metadata, or None if cancelled.
         """
         if not tournaments or tournaments is None:
             print("\nNo tournaments available.")
@@ -282,3 +313,18 @@ class View:
                 print("Invalid choice, try again.")
             except ValueError:
                 print("Please enter a number.")
+
+    def get_tournament_choice(self, max_n):
+        """Get a validated tournament number from user input.
+
+        Args:
+            max_n (int): The highest selectable tournament number.
+
+        Returns:
+            int or None: The selected number (1 to max_n), or None if cancelled with 0.
+        """
+        while True:
+            choice = input("Select an unfinished tournament by number (or 0 to cancel): ").strip()
+            if choice.isdecimal() and 0 <= int(choice) <= max_n:
+                return int(choice) or None
+            print(f"Invalid choice, enter a number between 0 and {max_n}.")